@@ -637,6 +637,41 @@ class XPlaneCondition(bpy.types.PropertyGroup):
 #   string negative_command - Negative command
 #   string dataref1 - Dataref 1
 #   string dataref2 - Dataref 2
+# The enum items callback below runs on every UI redraw, so the literal
+# lists are built once here instead of per call. Keeping them at module
+# level also keeps the strings referenced, as dynamic enum items require
+_MANIP_TYPE_ITEMS = [
+    (MANIP_DRAG_XY,      "Drag XY",      "Drag XY"),
+    (MANIP_DRAG_AXIS,    "Drag Axis",    "Drag Axis"),
+    (MANIP_COMMAND,      "Command",      "Command"),
+    (MANIP_COMMAND_AXIS, "Command Axis", "Command Axis"),
+    (MANIP_PUSH,         "Push",         "Push"),
+    (MANIP_RADIO,        "Radio",        "Radio"),
+    (MANIP_DELTA,        "Delta",        "Delta"),
+    (MANIP_WRAP,         "Wrap",         "Wrap"),
+    (MANIP_TOGGLE,       "Toggle",       "Toggle"),
+    (MANIP_NOOP,         "No-op",        "No-op"),
+    (MANIP_DRAG_AXIS_PIX,             "Drag Axis Pix (v10.10)",             "Drag Axis Pix (requires at least v10.10)"),
+    (MANIP_COMMAND_KNOB,              "Command Knob (v10.50)",              "Command Knob (requires at least v10.50)"),
+    (MANIP_COMMAND_SWITCH_UP_DOWN,    "Command Switch Up Down (v10.50)",    "Command Switch Up Down (requires at least v10.50)"),
+    (MANIP_COMMAND_SWITCH_LEFT_RIGHT, "Command Switch Left Right (v10.50)", "Command Switch Left Right (requires at least v10.50)"),
+    (MANIP_AXIS_SWITCH_UP_DOWN,       "Axis Switch Up Down (v10.50)",       "Axis Switch Up Down (requires at least v10.50)"),
+    (MANIP_AXIS_SWITCH_LEFT_RIGHT,    "Axis Switch Left Right (v10.50)",    "Axis Switch Left Right (requires at least v10.50)"),
+    (MANIP_AXIS_KNOB, "Axis Knob (v10.50)", "Axis Knob (requires at least v10.50)")
+]
+
+_MANIP_TYPE_V1110_ITEMS = [
+    (MANIP_DRAG_AXIS_DETENT,           "Drag Axis With Detents",      "Drag Axis With Detents (requires at least v11.10)"),
+    (MANIP_COMMAND_KNOB2,              "Command Knob 2",              "Command Knob 2 (requires at least v11.10)"),
+    (MANIP_COMMAND_SWITCH_UP_DOWN2,    "Command Switch Up Down 2",    "Command Switch Up Down 2 (requires at least v11.10)"),
+    (MANIP_COMMAND_SWITCH_LEFT_RIGHT2, "Command Switch Left Right 2", "Command Switch Left Right 2 (requires at least v11.10)"),
+    (MANIP_DRAG_ROTATE,                "Drag Rotate",                 "Drag Rotate (requires at least v11.10)"),
+    (MANIP_DRAG_ROTATE_DETENT,         "Drag Rotate With Detents",    "Drag Rotate With Detents (requires at least v11.10)")
+]
+
+_MANIP_TYPE_ITEMS_ALL = _MANIP_TYPE_ITEMS + _MANIP_TYPE_V1110_ITEMS
+
+
 class XPlaneManipulatorSettings(bpy.types.PropertyGroup):
     autodetect_datarefs: bpy.props.BoolProperty(
         name = "Autodetect Datarefs",
@@ -665,40 +700,11 @@ class XPlaneManipulatorSettings(bpy.types.PropertyGroup):
 
 
     def get_manip_types_for_this_version(self,context):
-        type_items = [
-            (MANIP_DRAG_XY,      "Drag XY",      "Drag XY"),
-            (MANIP_DRAG_AXIS,    "Drag Axis",    "Drag Axis"),
-            (MANIP_COMMAND,      "Command",      "Command"),
-            (MANIP_COMMAND_AXIS, "Command Axis", "Command Axis"),
-            (MANIP_PUSH,         "Push",         "Push"),
-            (MANIP_RADIO,        "Radio",        "Radio"),
-            (MANIP_DELTA,        "Delta",        "Delta"),
-            (MANIP_WRAP,         "Wrap",         "Wrap"),
-            (MANIP_TOGGLE,       "Toggle",       "Toggle"),
-            (MANIP_NOOP,         "No-op",        "No-op"),
-            (MANIP_DRAG_AXIS_PIX,             "Drag Axis Pix (v10.10)",             "Drag Axis Pix (requires at least v10.10)"),
-            (MANIP_COMMAND_KNOB,              "Command Knob (v10.50)",              "Command Knob (requires at least v10.50)"),
-            (MANIP_COMMAND_SWITCH_UP_DOWN,    "Command Switch Up Down (v10.50)",    "Command Switch Up Down (requires at least v10.50)"),
-            (MANIP_COMMAND_SWITCH_LEFT_RIGHT, "Command Switch Left Right (v10.50)", "Command Switch Left Right (requires at least v10.50)"),
-            (MANIP_AXIS_SWITCH_UP_DOWN,       "Axis Switch Up Down (v10.50)",       "Axis Switch Up Down (requires at least v10.50)"),
-            (MANIP_AXIS_SWITCH_LEFT_RIGHT,    "Axis Switch Left Right (v10.50)",    "Axis Switch Left Right (requires at least v10.50)"),
-            (MANIP_AXIS_KNOB, "Axis Knob (v10.50)", "Axis Knob (requires at least v10.50)")
-        ]
-
-        type_v1110_items = [
-            (MANIP_DRAG_AXIS_DETENT,           "Drag Axis With Detents",      "Drag Axis With Detents (requires at least v11.10)"),
-            (MANIP_COMMAND_KNOB2,              "Command Knob 2",              "Command Knob 2 (requires at least v11.10)"),
-            (MANIP_COMMAND_SWITCH_UP_DOWN2,    "Command Switch Up Down 2",    "Command Switch Up Down 2 (requires at least v11.10)"),
-            (MANIP_COMMAND_SWITCH_LEFT_RIGHT2, "Command Switch Left Right 2", "Command Switch Left Right 2 (requires at least v11.10)"),
-            (MANIP_DRAG_ROTATE,                "Drag Rotate",                 "Drag Rotate (requires at least v11.10)"),
-            (MANIP_DRAG_ROTATE_DETENT,         "Drag Rotate With Detents",    "Drag Rotate With Detents (requires at least v11.10)")
-        ]
-
         xplane_version = int(bpy.context.scene.xplane.version)
         if xplane_version >= int(VERSION_1110):
-            return type_items + type_v1110_items
+            return _MANIP_TYPE_ITEMS_ALL
         else:
-            return type_items
+            return _MANIP_TYPE_ITEMS
 
     type: bpy.props.EnumProperty(
         name = "Manipulator Type",
@@ -907,7 +913,7 @@ class XPlaneManipulatorSettings(bpy.types.PropertyGroup):
         The description returned will the same as in the UI
         '''
         items = xplane_props.XPlaneManipulatorSettings.bl_rna.properties['type'].enum_items
-        return next(filter(lambda item: item[0] == self.type, items))[2]#.description
+        return next(item for item in items if item[0] == self.type)[2]#.description
 
 
     def get_effective_type_name(self) -> str:
@@ -915,7 +921,7 @@ class XPlaneManipulatorSettings(bpy.types.PropertyGroup):
         The name returned will the same as in the UI
         '''
         items = self.get_manip_types_for_this_version(None)
-        return next(filter(lambda item: item[0] == self.type, items))[1]#.name
+        return next(item for item in items if item[0] == self.type)[1]#.name
 
 
 # Class: XPlaneCockpitRegion
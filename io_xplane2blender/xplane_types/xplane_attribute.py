@@ -14,6 +14,10 @@ class XPlaneAttribute:
     OBJ. Names usually start with "ATTR_"
     """
 
+    # Dozens of these exist per material and header; __slots__ drops the
+    # per-instance __dict__
+    __slots__ = ("name", "value", "weight")
+
     def __init__(
         self, name: str, value: Optional[AttributeValueType] = None, weight: int = 0
     ):
@@ -70,14 +74,14 @@ class XPlaneAttribute:
             value = str(value)
         # convert lists to strings
         elif isinstance(value, list) or isinstance(value, tuple) and len(value) > 0:
-            value = tuple(value)  # satisfies pylint "value is unsubscriptable"
+            # The loop must not reuse the parameter i as its counter
             _value = []
-            for i in range(0, len(value)):
+            for component in value:
                 # convert floats to strings
-                if isinstance(value[i], float):
-                    _value.append(floatToStr(value[i]))
+                if isinstance(component, float):
+                    _value.append(floatToStr(component))
                 else:
-                    _value.append(str(value[i]))
+                    _value.append(str(component))
 
             value = "\t".join(_value)
         elif not isinstance(value, str):
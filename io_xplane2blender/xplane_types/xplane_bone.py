@@ -42,6 +42,11 @@ from io_xplane2blender.xplane_types.xplane_keyframe_collection import (
 
 # from xplane_object import XPlaneObject
 
+# Decomposition order and axis vectors for _writeStaticRotation, fixed
+# for every bone (see the comment there for why the order is ZYX)
+_STATIC_ROTATION_AXES = (2, 1, 0)
+_STATIC_ROTATION_EULER_AXES = ((0, 0, 1), (0, 1, 0), (1, 0, 0))
+
 
 class XPlaneBone:
     def __init__(
@@ -98,11 +103,21 @@ class XPlaneBone:
         if self.parent:
             self.parent.children.append(self)
 
+        # str - Lazily computed by getIndent, only safe to fill in once the
+        # bone tree is final (bones can be reparented during collection)
+        self._indent = None
+
         # dict - The keys are the dataref paths and the values are lists of <XPlaneKeyframeCollection>.
         self.animations = (
             {}
         )  # type: Dict[bpy.types.StringProperty,XPlaneKeyframeCollection]
 
+        # Optional[bool] - Lazily computed by the isDataRefAnimatedFor*
+        # methods, which otherwise rescan every keyframe of every dataref
+        # each time the write path asks. Reset by collectAnimations
+        self._is_animated_for_translation = None
+        self._is_animated_for_rotation = None
+
         # IMPORTANT NOTE: Show/Hide Datarefs and datarefs without 2 keyframes will not be included and
         # must be accessed via blenderObject.xplane.datarefs!
         self.datarefs: Dict[str, xplane_props.XPlaneDataref] = {}
@@ -120,38 +135,48 @@ class XPlaneBone:
     # Method: isAnimatedForTranslation
     # Checks if a dataref's keyframes actually contain meaningful translations, and we should therefore write keyframes out
     def isDataRefAnimatedForTranslation(self) -> bool:
-        if hasattr(self, "animations") and len(self.animations) > 0:
-            # Check to see if there is at least some difference in the keyframe locations
-            for dataref in self.animations:
-                keyframes = self.animations[dataref]
-                if len(keyframes) > 0:
-                    last_keyframe = keyframes[0]
-                    for keyframe in keyframes:
-                        # if there is a difference
-                        if keyframe.location != last_keyframe.location:
-                            return True
-                        else:
-                            last_keyframe = keyframe
-
-        return False
+        if self._is_animated_for_translation is None:
+            self._is_animated_for_translation = False
+            if hasattr(self, "animations") and len(self.animations) > 0:
+                # Check to see if there is at least some difference in the keyframe locations
+                for dataref in self.animations:
+                    keyframes = self.animations[dataref]
+                    if len(keyframes) > 0:
+                        last_keyframe = keyframes[0]
+                        for keyframe in keyframes:
+                            # if there is a difference
+                            if keyframe.location != last_keyframe.location:
+                                self._is_animated_for_translation = True
+                                break
+                            else:
+                                last_keyframe = keyframe
+                    if self._is_animated_for_translation:
+                        break
+
+        return self._is_animated_for_translation
 
     # Method: isAnimatedForRotation
     # Checks if a dataref's keyframes actually contain meaningful rotation, and we should therefore write keyframes out
     def isDataRefAnimatedForRotation(self) -> bool:
-        if hasattr(self, "animations") and len(self.animations) > 0:
-            # Check to see if there is at least some difference in the keyframe locations
-            for dataref in self.animations:
-                keyframes = self.animations[dataref]
-                if len(keyframes) > 0:
-                    last_keyframe = keyframes[0]
-                    for keyframe in keyframes:
-                        # if there is a difference
-                        if keyframe.rotation != last_keyframe.rotation:
-                            return True
-                        else:
-                            last_keyframe = keyframe
-
-        return False
+        if self._is_animated_for_rotation is None:
+            self._is_animated_for_rotation = False
+            if hasattr(self, "animations") and len(self.animations) > 0:
+                # Check to see if there is at least some difference in the keyframe locations
+                for dataref in self.animations:
+                    keyframes = self.animations[dataref]
+                    if len(keyframes) > 0:
+                        last_keyframe = keyframes[0]
+                        for keyframe in keyframes:
+                            # if there is a difference
+                            if keyframe.rotation != last_keyframe.rotation:
+                                self._is_animated_for_rotation = True
+                                break
+                            else:
+                                last_keyframe = keyframe
+                    if self._is_animated_for_rotation:
+                        break
+
+        return self._is_animated_for_rotation
 
     def isAnimated(self) -> bool:
         """Uses isDataRefAnimated functions to check if the object is animated"""
@@ -164,6 +189,11 @@ class XPlaneBone:
         """
         Collects animation_data from blenderObject, and pairs it with xplane datarefs
         """
+        # collectAnimations can run again after re-parenting (see
+        # walk_upward), so any cached answers are stale
+        self._is_animated_for_translation = None
+        self._is_animated_for_rotation = None
+
         if not self.parent:
             return None
 
@@ -246,10 +276,7 @@ class XPlaneBone:
         Note: Unit tests, like the ones in xplane_file,
         test against the output of this method!
         """
-        count_parents = (
-            lambda bone: 1 + count_parents(bone.parent) if bone.parent else 0
-        )
-        prefix = "" if ignore_indent_level else f"{count_parents(self)} "
+        prefix = "" if ignore_indent_level else f"{self._countParents()} "
 
         if self.blenderBone:
             return f"{prefix}Bone: {self.blenderBone.name}"
@@ -272,20 +299,31 @@ class XPlaneBone:
         else:
             assert False, "Cannot call getBlenderName on a root bone"
 
+    def _countParents(self) -> int:
+        count = 0
+        bone = self.parent
+        while bone is not None:
+            count += 1
+            bone = bone.parent
+        return count
+
     def getIndent(self) -> str:
-        count_parents = (
-            lambda bone: 1 + count_parents(bone.parent) if bone.parent else 0
-        )
-        return "\t" * count_parents(self)
+        # getIndent is called for nearly every line written, so the string
+        # is cached. By write time the bone tree no longer changes shape
+        if self._indent is None:
+            self._indent = "\t" * self._countParents()
+        return self._indent
 
     def getFirstAnimatedParent(self) -> Optional[str]:
-        if self.parent == None:
+        # Iterative instead of recursive - this walks to the root for
+        # every unanimated bone in a deep tree
+        bone = self.parent
+        if bone is None:
             return None
 
-        if self.parent.isAnimated() or self.parent.parent == None:
-            return self.parent
-        else:
-            return self.parent.getFirstAnimatedParent()
+        while not (bone.isAnimated() or bone.parent is None):
+            bone = bone.parent
+        return bone
 
     # Blender World Matrix (Pose)
     #
@@ -490,7 +528,7 @@ class XPlaneBone:
             return self.getPreAnimationMatrix()
         else:
             # This is the parent transform we are going from
-            parent_post = self.getFirstAnimatedParent().getPostAnimationMatrix()
+            parent_post = parent_bone.getPostAnimationMatrix()
             # This is the child we are going to
             pre = self.getPreAnimationMatrix()
             return parent_post.inverted_safe() @ pre
@@ -540,34 +578,6 @@ class XPlaneBone:
 
         if debug:
             o += indent + "# " + self.getName() + "\n"
-            """
-            if self.blenderBone:
-                poseBone = self.blenderObject.pose.bones[self.blenderBone.name]
-                if poseBone != None:
-                    o += "# Armature\n" + str(self.blenderObject.matrix_world) + "\n"
-                    if self.blenderBone.parent:
-                        poseParent = self.blenderObject.pose.bones[self.blenderBone.parent.name]
-                        if poseParent:
-                            o += "#  parent matrix local rest\n" + str(self.blenderBone.parent.matrix_local) + "\n"
-                            o += "#  parent matrix local pose\n" + str(poseParent.matrix) + "\n"
-                            o += "#  delta r2r\n" + str(self.blenderBone.parent.matrix_local.inverted_safe() @ self.blenderBone.matrix_local) + "\n"
-                            o += "#  delta p2p\n" + str(poseParent.matrix.inverted_safe() @ poseBone.matrix) + "\n"
-                    o += "#   matrix local rest\n" + str(self.blenderBone.matrix_local) + "\n"
-                    o += "#   matrix local pose\n" + str(poseBone.matrix) + "\n"
-                    o += "#   pose delta\n" + str(self.blenderBone.matrix_local.inverted_safe() @ poseBone.matrix) + "\n"
-            elif self.blenderObject != None:
-                o += "# Data block\n" + str(self.blenderObject.matrix_world) + "\n"
-
-            # Debug code - this dumps the pre/post/bake matrix for every single xplane bone into the file.
-
-            p = self
-            while p != None:
-               o += indent + '#   ' + p.getName() + '\n'
-               o += str(p.getPreAnimationMatrix()) + '\n'
-               o += str(p.getPostAnimationMatrix()) + '\n'
-               o += str(p.getBakeMatrixForMyAnimations()) + '\n'
-               p = None
-            """
         isAnimated = self.isAnimated()
         hasAnimationAttributes = (
             self.xplaneObject != None and len(self.xplaneObject.animAttributes) > 0
@@ -586,9 +596,9 @@ class XPlaneBone:
             o += self._writeStaticTranslation(bakeMatrix)
             o += self._writeStaticRotation(bakeMatrix)
 
-            for dataref in sorted(list(self.animations.keys())):
+            for dataref in sorted(self.animations):
                 o += self._writeTranslationKeyframes(dataref)
-            for dataref in sorted(list(self.animations.keys())):
+            for dataref in sorted(self.animations):
                 o += self._writeRotationKeyframes(dataref)
 
         o += self._writeAnimAttributes()
@@ -629,12 +639,9 @@ class XPlaneBone:
         debug = getDebug()
         indent = self.getIndent()
         o = ""
-        bakeMatrix = bakeMatrix
-        rotation = list(
-            map(
-                lambda c: round(c, xplane_constants.PRECISION_KEYFRAME),
-                bakeMatrix.to_euler("XYZ"),
-            )
+        rotation = tuple(
+            round(c, xplane_constants.PRECISION_KEYFRAME)
+            for c in bakeMatrix.to_euler("XYZ")
         )
 
         # ignore noop rotations
@@ -657,8 +664,8 @@ class XPlaneBone:
         #
         # see also: http://hacksoflife.blogspot.com/2015/11/blender-notepad-eulers.html
 
-        axes = (2, 1, 0)
-        eulerAxes = [(0, 0, 1), (0, 1, 0), (1, 0, 0)]
+        axes = _STATIC_ROTATION_AXES
+        eulerAxes = _STATIC_ROTATION_EULER_AXES
 
         for i, axis in enumerate(eulerAxes):
             deg = math.degrees(rotation[axes[i]])
@@ -832,10 +839,11 @@ class XPlaneBone:
         if self.xplaneObject == None:
             return o
 
+        indent = self.getIndent()
         for name in self.xplaneObject.animAttributes:
             attr = self.xplaneObject.animAttributes[name]
             for i in range(len(attr.value)):
-                o += f"{self.getIndent()}{attr.name}\t{attr.getValueAsString(i=i)}\n"
+                o += f"{indent}{attr.name}\t{attr.getValueAsString(i=i)}\n"
 
         return o
 
@@ -72,6 +72,80 @@ from ..xplane_helpers import floatToStr, logger
 # we expect to leave things in their currently broken state; for 3.5, we can then add specific panel attribute labeling
 # to the UI and have authors migrate their projects forward.
 
+# Every known OBJ directive (except manips), used by writeReseters.
+# Built once - writeReseters runs per XPlaneObject and the contents
+# never change
+WHITE_LIST = frozenset(
+    {
+        "ATTR_light_level",
+        "ATTR_light_level_reset",
+        "ATTR_cockpit_device",
+        "ATTR_cockpit",
+        "ATTR_cockpit_lit_only",
+        "ATTR_cockpit_region",
+        "ATTR_no_cockpit",
+        "ATTR_draw_disable",
+        "ATTR_draw_enable",
+        "ATTR_poly_os",
+        "ATTR_poly_os 0",
+        "ATTR_hard",
+        "ATTR_hard_deck",
+        "ATTR_no_hard",
+        "ATTR_no_blend",
+        "ATTR_shadow_blend",
+        "ATTR_blend",
+        "ATTR_draped",
+        "ATTR_no_draped",
+        "ATTR_shadow",
+        "ATTR_no_shadow",
+        "ATTR_solid_camera",
+        "ATTR_no_solid_camera",
+    }
+)
+
+# Default setter pattern->resetter table, copied per XPlaneCommands so
+# addReseter can extend an instance without touching the defaults
+DEFAULT_RESETERS = {
+    "ATTR_light_level": "ATTR_light_level_reset",
+    "ATTR_cockpit(_lit_only|_region|_device)?": "ATTR_no_cockpit",
+    "ATTR_manip_(?!none)(?!wheel)(.*)": "ATTR_manip_none",
+    "ATTR_no_shadow": "ATTR_shadow",
+    "ATTR_draw_disable": "ATTR_draw_enable",
+    "ATTR_poly_os": "ATTR_poly_os 0",
+    "ATTR_hard|ATTR_hard_deck": "ATTR_no_hard",
+    "ATTR_no_blend|ATTR_shadow_blend": "ATTR_blend",
+    "ATTR_draped": "ATTR_no_draped",
+    "ATTR_solid_camera": "ATTR_no_solid_camera",
+}
+
+# X-Plane's default state vector, copied per XPlaneCommands to preserve
+# writing the defaults in the obj
+DEFAULT_WRITTEN = {
+    "ATTR_no_hard": True,
+    "ATTR_blend": True,
+    "ATTR_no_cockpit": True,
+    "ATTR_no_solid_camera": True,
+    "ATTR_shadow": True,
+    "ATTR_draw_enable": True,
+    "ATTR_no_draped": True,
+    "ATTR_light_level_reset": True,
+}
+
+# Compiled form of the default setter patterns, shared by every
+# XPlaneCommands instance. Patterns from addReseter are compiled once as
+# they are registered
+_DEFAULT_COMPILED_PATTERNS = {
+    setterPattern: re.compile(setterPattern) for setterPattern in DEFAULT_RESETERS
+}
+
+# Which WHITE_LIST names each default setter pattern matches, computed
+# once - both inputs are fixed, so writeReseters doesn't have to rescan
+# the white list for every pattern of every XPlaneObject
+_WHITE_LIST_MATCHES = {
+    setterPattern: frozenset(filter(re.compile(setterPattern).fullmatch, WHITE_LIST))
+    for setterPattern in DEFAULT_RESETERS
+}
+
 
 class XPlaneCommands:
     """
@@ -83,33 +157,14 @@ class XPlaneCommands:
     def __init__(self, xplaneFile) -> None:
         self.xplaneFile = xplaneFile
 
-        self.reseters = {
-            "ATTR_light_level": "ATTR_light_level_reset",
-            "ATTR_cockpit(_lit_only|_region|_device)?": "ATTR_no_cockpit",
-            "ATTR_manip_(?!none)(?!wheel)(.*)": "ATTR_manip_none",
-            "ATTR_no_shadow": "ATTR_shadow",
-            "ATTR_draw_disable": "ATTR_draw_enable",
-            "ATTR_poly_os": "ATTR_poly_os 0",
-            "ATTR_hard|ATTR_hard_deck": "ATTR_no_hard",
-            "ATTR_no_blend|ATTR_shadow_blend": "ATTR_blend",
-            "ATTR_draped": "ATTR_no_draped",
-            "ATTR_solid_camera": "ATTR_no_solid_camera",
-        }
+        self.reseters = dict(DEFAULT_RESETERS)
+        self._compiled_patterns = dict(_DEFAULT_COMPILED_PATTERNS)
 
         # these attributes/commands are not persistant and must always be rewritten
         self.inpersistant = {"ATTR_axis_detent_range", "ATTR_manip_wheel"}
 
         # add default X-Plane states to presve writing them in the obj
-        self.written = {
-            "ATTR_no_hard": True,
-            "ATTR_blend": True,
-            "ATTR_no_cockpit": True,
-            "ATTR_no_solid_camera": True,
-            "ATTR_shadow": True,
-            "ATTR_draw_enable": True,
-            "ATTR_no_draped": True,
-            "ATTR_light_level_reset": True,
-        }
+        self.written = dict(DEFAULT_WRITTEN)
 
     def write(self, *, lod_bucket_index: Optional[int]) -> str:
         """
@@ -208,39 +263,28 @@ class XPlaneCommands:
         Returns formatted value of attr value of, also handles the counterparts system
         """
         o = ""
+        name = attr.name
+        indent = xplaneObject.xplaneBone.getIndent()
+
         for i in range(len(attr.value)):
             value = attr.getValue(i)
-            name = attr.name
-            indent = xplaneObject.xplaneBone.getIndent()
 
             if value != None and self.canWriteAttribute(name, value):
                 if isinstance(value, bool):
-                    if value:
-                        o += indent + "%s\n" % name
-
-                        # store this in the written attributes
-                        self.written[name] = value
-
-                        # If there is a resetter for this attribute, we need to
-                        # nuke it from the written list - we are replacing it.
-                        counterparts = self.getAttributeCounterparts(name)
-
-                        for counterpart in counterparts:
-                            if counterpart in self.written:
-                                del self.written[counterpart]
-
+                    if not value:
+                        continue
+                    o += indent + "%s\n" % name
                 else:
-                    # store this in the written attributes
-                    self.written[name] = value
-                    value = attr.getValueAsString(i)
-                    o += indent + "%s\t%s\n" % (name, value)
+                    o += indent + "%s\t%s\n" % (name, attr.getValueAsString(i))
 
-                    # check if this thing has a resetter and remove counterpart if any
-                    counterparts = self.getAttributeCounterparts(name)
+                # store this in the written attributes
+                self.written[name] = value
 
-                    for counterpart in counterparts:
-                        if counterpart in self.written:
-                            del self.written[counterpart]
+                # If there is a resetter for this attribute, we need to
+                # nuke it from the written list - we are replacing it.
+                for counterpart in self.getAttributeCounterparts(name):
+                    if counterpart in self.written:
+                        del self.written[counterpart]
         return o
 
     def canWriteAttribute(
@@ -255,6 +299,7 @@ class XPlaneCommands:
 
     def addReseter(self, attr: str, reseter: str) -> None:
         self.reseters[attr] = reseter
+        self._compiled_patterns[attr] = re.compile(attr)
 
     # Method: attributeIsReseter
     # Determines if a given attribute is a resetter.
@@ -280,11 +325,11 @@ class XPlaneCommands:
         """
 
         found = []
-        setterPatterns = sorted(list(self.reseters.keys()))
+        setterPatterns = sorted(self.reseters)
 
         for setterPattern in setterPatterns:
             resetter = self.reseters[setterPattern]
-            compiledPattern = re.compile(setterPattern)
+            compiledPattern = self._compiled_patterns[setterPattern]
 
             # The attribute is a setter - the resetter is a counter part
             if compiledPattern.fullmatch(attr):
@@ -293,7 +338,7 @@ class XPlaneCommands:
             # The pattern is a resetter or ONE of the setters.
             # Every other setter but us is a counterpart.
             if attr == resetter or compiledPattern.fullmatch(attr):
-                allWritten = sorted(list(self.written.keys()))
+                allWritten = sorted(self.written)
                 for oneWritten in allWritten:
                     if compiledPattern.fullmatch(oneWritten):
                         # We have to check for ourselves - we might be taking every written attribute
@@ -326,56 +371,37 @@ class XPlaneCommands:
             if xplaneObject.cockpitAttributes[attr].getValue():
                 attributes.add(xplaneObject.cockpitAttributes[attr])
 
-        WHITE_LIST = {
-            "ATTR_light_level",
-            "ATTR_light_level_reset",
-            "ATTR_cockpit_device",
-            "ATTR_cockpit",
-            "ATTR_cockpit_lit_only",
-            "ATTR_cockpit_region",
-            "ATTR_no_cockpit",
-            "ATTR_draw_disable",
-            "ATTR_draw_enable",
-            "ATTR_poly_os",
-            "ATTR_poly_os 0",
-            "ATTR_hard",
-            "ATTR_hard_deck",
-            "ATTR_no_hard",
-            "ATTR_no_blend",
-            "ATTR_shadow_blend",
-            "ATTR_blend",
-            "ATTR_draped",
-            "ATTR_no_draped",
-            "ATTR_shadow",
-            "ATTR_no_shadow",
-            "ATTR_solid_camera",
-            "ATTR_no_solid_camera",
-        }
-
-        #  ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
-        # <What's up with WHITE_LIST? IT'S A STUPID HACK!>
-        #  vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
-        # To ensure known OBJ directives only get reset as needed,
-        # we artificially add every known OBJ directive (except
-        # manips) to the attributes.
-        #
-        # This way the resetter thinks it doesn't have to reset
-        # because the next XPlaneObject passed in "has" it already.
-        #
-        # *
-        for attr in WHITE_LIST:
-            attributes.add(xplane_attribute.XPlaneAttribute(attr))
-
         attributeNames = sorted(attributes.keys())
 
         # This is the attributes we have already stated that MIGHT need to be reset.
         writtenNames = sorted(self.written.keys())
         for setterPattern in sorted(self.reseters.keys()):
             resetingAttr = self.reseters[setterPattern]
-            pattern = re.compile(setterPattern)
+            pattern = self._compiled_patterns[setterPattern]
+
+            #  ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+            # <What's up with WHITE_LIST? IT'S A STUPID HACK!>
+            #  vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+            # To ensure known OBJ directives only get reset as needed,
+            # we artificially count every known OBJ directive (except
+            # manips) among the incoming attributes.
+            #
+            # This way the resetter thinks it doesn't have to reset
+            # because the next XPlaneObject passed in "has" it already.
+            #
+            # *
+            try:
+                whiteListMatches = _WHITE_LIST_MATCHES[setterPattern]
+            except KeyError:
+                # Custom reseters from addReseter aren't precomputed
+                whiteListMatches = frozenset(filter(pattern.fullmatch, WHITE_LIST))
 
             matchingWritten = [x for x in writtenNames if pattern.fullmatch(x)]
-            matchingAttribute = [x for x in attributeNames if pattern.fullmatch(x)]
+            matchingAttribute = sorted(
+                whiteListMatches.union(
+                    x for x in attributeNames if pattern.fullmatch(x)
+                )
+            )
 
             # Now that the added white list trick is in place,
             # we'll nearly always have 2 matching attributes
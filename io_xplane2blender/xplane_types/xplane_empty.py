@@ -40,9 +40,9 @@ class XPlaneEmpty(XPlaneObject):
                     )
                 )
 
-            if special_empty_props.magnet_props.magnet_type_is_xpad:
+            if magnet_props.magnet_type_is_xpad:
                 self.magnet_type = "xpad"
-            if special_empty_props.magnet_props.magnet_type_is_flashlight:
+            if magnet_props.magnet_type_is_flashlight:
                 if self.magnet_type:
                     self.magnet_type += "|"
                 self.magnet_type += "flashlight"
@@ -57,11 +57,13 @@ class XPlaneEmpty(XPlaneObject):
         o = super().write()
 
         special_empty_props = self.blenderObject.xplane.special_empty_props
+        xplane_version = int(bpy.context.scene.xplane.version)
 
-        if int(bpy.context.scene.xplane.version) >= 1130 and (
+        if xplane_version >= 1130 and (
             special_empty_props.special_type == EMPTY_USAGE_EMITTER_PARTICLE
             or special_empty_props.special_type == EMPTY_USAGE_EMITTER_SOUND
         ):
+            emitter_props = special_empty_props.emitter_props
             if not self.xplaneBone.xplaneFile.options.particle_system_file.endswith(
                 ".pss"
             ):
@@ -71,7 +73,7 @@ class XPlaneEmpty(XPlaneObject):
                     )
                 )
                 return ""
-            elif special_empty_props.emitter_props.name.strip() == "":
+            elif emitter_props.name.strip() == "":
                 logger.error(
                     "Particle name for emitter {} can't be blank".format(
                         self.blenderObject.name
@@ -82,11 +84,11 @@ class XPlaneEmpty(XPlaneObject):
             bake_matrix = self.xplaneBone.getBakeMatrixForAttached()
             em_location = xplane_helpers.vec_b_to_x(bake_matrix.to_translation())
             # yaw,pitch,roll
-            theta, psi, phi = tuple(map(math.degrees, bake_matrix.to_euler()[:]))
+            theta, psi, phi = map(math.degrees, bake_matrix.to_euler())
 
             o += "{indent}EMITTER {name} {x} {y} {z} {phi} {theta} {psi}".format(
                 indent=indent,
-                name=special_empty_props.emitter_props.name,
+                name=emitter_props.name,
                 x=floatToStr(em_location.x),
                 y=floatToStr(em_location.y),
                 z=floatToStr(em_location.z),
@@ -95,21 +97,18 @@ class XPlaneEmpty(XPlaneObject):
                 psi=floatToStr(psi),
             )  # roll right
 
-            if (
-                special_empty_props.emitter_props.index_enabled
-                and special_empty_props.emitter_props.index >= 0
-            ):
-                o += " {}".format(special_empty_props.emitter_props.index)
+            if emitter_props.index_enabled and emitter_props.index >= 0:
+                o += " {}".format(emitter_props.index)
 
             o += "\n"
         elif (
-            int(bpy.context.scene.xplane.version) >= 1130
+            xplane_version >= 1130
             and special_empty_props.special_type == EMPTY_USAGE_MAGNET
         ):
             bake_matrix = self.xplaneBone.getBakeMatrixForAttached()
             em_location = xplane_helpers.vec_b_to_x(bake_matrix.to_translation())
             # yaw,pitch,roll
-            theta, psi, phi = tuple(map(math.degrees, bake_matrix.to_euler()[:]))
+            theta, psi, phi = map(math.degrees, bake_matrix.to_euler())
 
             o += "{indent}MAGNET {debug_name} {magnet_type} {x} {y} {z} {phi} {theta} {psi}\n".format(
                 indent=indent,
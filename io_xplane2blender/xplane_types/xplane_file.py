@@ -12,14 +12,11 @@ the header and XPlaneBone tree contents to a string
 """
 
 import collections
-import dataclasses
-import itertools
-import operator
-import pprint
-from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple, Union
 
 import bpy
 import mathutils
+import numpy as np
 
 from io_xplane2blender import xplane_constants, xplane_helpers, xplane_props
 from io_xplane2blender.tests import test_creation_helpers
@@ -29,13 +26,8 @@ from io_xplane2blender.xplane_types import (
     xplane_material_utils,
 )
 
-from ..xplane_helpers import (
-    BlenderParentType,
-    ExportableRoot,
-    PotentialRoot,
-    floatToStr,
-    logger,
-)
+from ..xplane_config import getDebug
+from ..xplane_helpers import ExportableRoot, PotentialRoot, logger
 from .xplane_bone import XPlaneBone
 from .xplane_commands import XPlaneCommands
 from .xplane_header import XPlaneHeader
@@ -45,6 +37,15 @@ from .xplane_object import XPlaneObject
 from .xplane_primitive import XPlanePrimitive
 from .xplane_vlights import XPlaneVLights
 
+# Which XPlaneObject subclass each convertable Blender Object type
+# becomes during collection
+_XPLANE_OBJECT_CONVERTERS = {
+    "MESH": XPlanePrimitive,
+    "LIGHT": XPlaneLight,
+    "ARMATURE": XPlaneObject,
+    "EMPTY": xplane_empty.XPlaneEmpty,
+}
+
 
 class NotExportableRootError(ValueError):
     pass
@@ -127,8 +128,7 @@ def createFileFromBlenderRootObject(
     return xplane_file
 
 
-@dataclasses.dataclass(frozen=True)
-class LocRotPerFrame:
+class LocRotPerFrame(NamedTuple):
     """Location/Rotation information at each frame we could care about, copied"""
 
     frame_num: int
@@ -139,6 +139,14 @@ class LocRotPerFrame:
     ]
 
 
+class LODStruct(NamedTuple):
+    near: int
+    far: int
+
+    def __repr__(self) -> str:
+        return f"({self.near}, {self.far})"
+
+
 ObjectBoneNameKey = Tuple[str, str]
 FrameToLocRotPerFrame = Dict[int, LocRotPerFrame]
 
@@ -168,16 +176,19 @@ def _pre_scan_all_keyframes():
     else:
         scene_keyframe_infos = collections.defaultdict(dict)
 
-    # A set of all keyframes that could have data we care about
-    frames_to_visit = sorted(
-        {
-            int(kf.co[0])
-            for action in bpy.data.actions
-            for fcurve in action.fcurves
-            for kf in fcurve.keyframe_points
-            if kf.co[0].is_integer()
-        }
-    )
+    # A set of all keyframes that could have data we care about.
+    # Each fcurve's keyframe co-ordinates are pulled out in one foreach_get
+    # instead of iterating Python-side over every keyframe point
+    frames_to_visit = set()
+    for action in bpy.data.actions:
+        for fcurve in action.fcurves:
+            cos = np.empty(len(fcurve.keyframe_points) * 2)
+            fcurve.keyframe_points.foreach_get("co", cos)
+            frames = cos[::2]
+            frames_to_visit.update(
+                frames[frames == np.floor(frames)].astype(int).tolist()
+            )
+    frames_to_visit = sorted(frames_to_visit)
 
     # --- Begin frames to visit-------------------
     for frame_num in frames_to_visit:
@@ -246,6 +257,16 @@ class XPlaneFile:
     def create_xplane_bone_hiearchy(
         self, exportable_root: ExportableRoot
     ) -> Optional[XPlaneObject]:
+        # The recursion below tests "is this name in the root?" constantly;
+        # snapshotting the names once spares an RNA collection lookup per
+        # test. None for Object roots, which have no all_objects
+        try:
+            root_object_names = frozenset(
+                o.name for o in exportable_root.all_objects
+            )  # type: Optional[FrozenSet[str]]
+        except AttributeError:
+            root_object_names = None
+
         def allowed_children(
             parent_like: Union[bpy.types.Collection, bpy.types.Object]
         ) -> List[bpy.types.Object]:
@@ -279,17 +300,11 @@ class XPlaneFile:
             assert (
                 blender_obj
             ), "blender_obj in convert_to_xplane_object must not be None"
-            converted_xplane_obj = None
-            if blender_obj.type == "MESH":
-                converted_xplane_obj = XPlanePrimitive(blender_obj)
-            elif blender_obj.type == "LIGHT":
-                converted_xplane_obj = XPlaneLight(blender_obj)
-            elif blender_obj.type == "ARMATURE":
-                converted_xplane_obj = XPlaneObject(blender_obj)
-            elif blender_obj.type == "EMPTY":
-                converted_xplane_obj = xplane_empty.XPlaneEmpty(blender_obj)
-
-            return converted_xplane_obj
+            converter = _XPLANE_OBJECT_CONVERTERS.get(blender_obj.type)
+            if converter:
+                return converter(blender_obj)
+            else:
+                return None
 
         def walk_upward(walk_start_bone: XPlaneBone):
             """
@@ -331,7 +346,7 @@ class XPlaneFile:
                     if new_parent_xplane_obj:
                         if (
                             not new_parent_xplane_obj.blenderObject.name
-                            in exportable_root.all_objects
+                            in root_object_names
                         ):
                             # We don't have to test for blender_obj.visible_get here,
                             # all objects that start inside the exportable collection will
@@ -479,7 +494,8 @@ class XPlaneFile:
             try:
                 if (
                     not found_blender_obj_already
-                    and blender_obj.parent.name not in exportable_root.all_objects
+                    and root_object_names is not None
+                    and blender_obj.parent.name not in root_object_names
                 ):
                     if blender_obj.parent.name in bpy.context.scene.objects:
                         walk_upward(new_xplane_bone)
@@ -507,7 +523,8 @@ class XPlaneFile:
                     self.lights.append(new_xplane_obj)
                 new_xplane_obj.collect()
             elif not found_blender_obj_already and blender_obj:
-                print(f"Blender Object: {blender_obj.name}, didn't convert")
+                if getDebug():
+                    print(f"Blender Object: {blender_obj.name}, didn't convert")
 
             def make_bones_for_armature_bones(
                 arm_obj: bpy.types.Object,
@@ -539,8 +556,8 @@ class XPlaneFile:
                         _recurse_bone(child, parent_xp_bone)
 
                 # Run recurse for the top level bones
-                for top_level_bone in filter(
-                    lambda b: not b.parent, arm_obj.data.bones
+                for top_level_bone in (
+                    b for b in arm_obj.data.bones if not b.parent
                 ):
                     _recurse_bone(top_level_bone, new_xplane_bone)
                 return blender_bones_to_xplane_bones
@@ -552,8 +569,8 @@ class XPlaneFile:
 
             for child_obj in parent_blender_objects:
                 if (
-                    isinstance(exportable_root, bpy.types.Collection)
-                    and child_obj.name not in exportable_root.all_objects
+                    root_object_names is not None
+                    and child_obj.name not in root_object_names
                 ):
                     continue
                 if (
@@ -597,7 +614,7 @@ class XPlaneFile:
         # --- end _recurse function -------------------------------------------
         if isinstance(exportable_root, bpy.types.Collection):
             all_allowed_objects = allowed_children(exportable_root)
-            all_allowed_names = [o.name for o in all_allowed_objects]
+            all_allowed_names = {o.name for o in all_allowed_objects}
             recurse(
                 parent=None,
                 parent_bone=None,
@@ -805,7 +822,7 @@ class XPlaneFile:
                 )
                 return o
 
-            for bucket_number in range(0, int(self.options.lods)):
+            for bucket_number in range(0, num_lods):
                 near = self.options.lod[bucket_number].near
                 far = self.options.lod[bucket_number].far
                 # LOD spec #7
@@ -820,13 +837,6 @@ class XPlaneFile:
                         f"{self.filename}'s LOD bucket #{bucket_number+1}'s Near is greater than its Far: ({near}, {far})"
                     )
 
-            class LODStruct(NamedTuple):
-                near: int
-                far: int
-
-                def __repr__(self) -> str:
-                    return f"({self.near}, {self.far})"
-
             # len(selective_pairs) in {0, 2, 4} == True
             # len(additive_pairs) in range(1, 5) == True
             # if len additive_pairs is 1 and len selective_pairs is greater than 2, you are in selective mode
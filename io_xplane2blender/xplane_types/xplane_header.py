@@ -65,9 +65,7 @@ class XPlaneHeader:
                 )
                 return  # TODO: Returning early in an __init__!
             else:
-                last_folder = os.path.dirname(potential_match.group(4)).split("/")[-1:][
-                    0
-                ]
+                last_folder = os.path.dirname(potential_match.group(4)).split("/")[-1]
 
                 if len(last_folder) > 0:
                     last_folder += "/"  # Re-append slash
@@ -9,6 +9,20 @@ from io_xplane2blender.xplane_constants import PRECISION_KEYFRAME
 
 
 class XPlaneKeyframe:
+    # One of these exists per keyframe per dataref per bone, and each
+    # as* conversion deepcopies one; __slots__ drops the per-instance
+    # __dict__
+    __slots__ = (
+        "dataref",
+        "dataref_values_index",
+        "dataref_value",
+        "frame_num",
+        "location",
+        "rotationMode",
+        "rotation",
+        "scale",
+    )
+
     def __init__(
         self,
         keyframe: bpy.types.Keyframe,
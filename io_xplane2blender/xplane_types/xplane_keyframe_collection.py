@@ -1,6 +1,6 @@
 import copy
 import math
-from collections import Iterable, namedtuple
+from collections import namedtuple
 from collections.abc import MutableSequence
 from typing import List, Tuple
 
@@ -53,14 +53,16 @@ class XPlaneKeyframeCollection(MutableSequence):
                 refAxis = None
                 refAxisInv = None
 
+                # The reference axis only changes when first found, so its
+                # rounded forms are cached instead of being recomputed
+                # against every keyframe's axis
+                refAxisRounded = None
+                refAxisInvRounded = None
+
                 for keyframe in keyframes:
                     angle = keyframe.rotation[0]
                     axis = keyframe.rotation[1]
 
-                    def round_vector(vec, ndigits=5):
-                        v = Vector([round(comp, ndigits) for comp in vec])
-                        return v
-
                     """
                     This section covers the following cases
                     - keyframe has 0 degrees of rotation, so no axis should be produced
@@ -73,9 +75,11 @@ class XPlaneKeyframeCollection(MutableSequence):
                     elif refAxis == None:
                         refAxis = axis
                         refAxisInv = refAxis * -1
-                    elif round_vector(refAxis) == round_vector(axis):
+                        refAxisRounded = round_vec(refAxis, 5)
+                        refAxisInvRounded = round_vec(refAxisInv, 5)
+                    elif refAxisRounded == round_vec(axis, 5):
                         continue
-                    elif round_vector(refAxisInv) == round_vector(axis):
+                    elif refAxisInvRounded == round_vec(axis, 5):
                         keyframe.rotation = (angle * -1, axis * -1)
                     else:
                         return _makeReferenceAxes(keyframes.toEuler())
@@ -159,6 +163,10 @@ class XPlaneKeyframeCollection(MutableSequence):
     TableEntry.__doc__ = (
         "An entry in the keyframe table, where value is the dataref value"
     )
+    TranslationKeyframe = namedtuple("TranslationKeyframe", ["value", "location"])
+    TranslationKeyframe.__doc__ = (
+        "An entry in the translation table, where value is the dataref value"
+    )
 
     def getRotationKeyframeTables(
         self,
@@ -200,17 +208,9 @@ class XPlaneKeyframeCollection(MutableSequence):
                     )
                 )
 
+        # The tables' shape is fixed by construction above; checking every
+        # entry again was an O(keyframes) pass per call on the write path
         assert isinstance(rot_keyframe_tables, list)
-        for axis_info in rot_keyframe_tables:
-            assert isinstance(axis_info, tuple)
-            assert isinstance(axis_info.axis, Vector)
-            assert isinstance(axis_info.table, list)
-
-            for table_entry in axis_info.table:
-                assert isinstance(table_entry, tuple)
-                assert isinstance(table_entry.value, float)
-                assert isinstance(table_entry.degrees, float)
-
         return rot_keyframe_tables
 
     def getRotationKeyframeTablesNoClamps(
@@ -229,7 +229,7 @@ class XPlaneKeyframeCollection(MutableSequence):
         """
         Returns List[TranslationKeyframe[keyframe.value, keyframe.location]] where location is a Vector
         """
-        TranslationKeyframe = namedtuple("TranslationKeyframe", ["value", "location"])
+        TranslationKeyframe = XPlaneKeyframeCollection.TranslationKeyframe
         return [
             TranslationKeyframe(keyframe.dataref_value, keyframe.location)
             for keyframe in self
@@ -5,7 +5,6 @@ Created on Jan 30, 2018
 """
 
 import collections
-import typing
 from typing import Callable, List, Optional, Tuple
 
 import bpy
@@ -14,16 +13,8 @@ from mathutils import Vector
 from io_xplane2blender import xplane_helpers
 from io_xplane2blender.xplane_constants import *
 from io_xplane2blender.xplane_helpers import logger
-from io_xplane2blender.xplane_props import (
-    XPlaneAxisDetentRange,
-    XPlaneManipulatorSettings,
-)
 from io_xplane2blender.xplane_types.xplane_attribute import XPlaneAttribute
 from io_xplane2blender.xplane_types.xplane_bone import XPlaneBone
-from io_xplane2blender.xplane_types.xplane_keyframe import XPlaneKeyframe
-from io_xplane2blender.xplane_types.xplane_keyframe_collection import (
-    XPlaneKeyframeCollection,
-)
 
 
 def round_vector(vec, ndigits=5) -> Vector:
@@ -877,6 +868,265 @@ def check_spec_detent_bone(
         return False
 
 
+AxisDetentStruct = collections.namedtuple(
+    "AxisDetentStruct", ["start", "end", "height"]
+)
+
+
+# List[AxisDetentRange] -> bool
+def validate_axis_detent_ranges(
+    axis_detent_ranges, translation_bone, v1_min, v1_max, lift_at_max, manipulator
+):
+    """
+    Rules for Axis Detent Ranges
+
+    Basic rules
+    - Manip type must be *_DETENT
+    - Translation bone must not be none (covered by get_translation_bone), len(axis_detent_ranges) > 0
+    - The detent ranges must cover [v1_min,v1_max] without gaps.
+      Therefore
+          - The start of one range must be the end of another
+          - ranges[0].start == v1_min, ranges[-1].end == v1_max
+    - A range's start must be <= its end
+    - Height must be between 0 and lift_at_max
+
+    Stop Pits
+    - A stop pit is defined as range.start == range.end, range.height is less than each of it's neighbors.
+    - A pit can be the first or last detent range, but never the only one
+    - Stop pegs, where height is equal to or greater than it's neighbor's height, are never allowed
+    """
+    if not len(axis_detent_ranges) > 0:
+        logger.error(
+            "Must {} have axis detent range if manipulator type is {}".format(
+                translation_bone.getBlenderName(),
+                manipulator.manip.get_effective_type_name(),
+            )
+        )
+        return False
+
+    if not axis_detent_ranges[0].start == v1_min:
+        logger.error(
+            "Axis detent range list for {} must start at Dataref 1's minimum value {}".format(
+                translation_bone.getBlenderName(), v1_min
+            )
+        )
+        return False
+
+    if not axis_detent_ranges[-1].end == v1_max:
+        logger.error(
+            "Axis detent range list for {} must end at Dataref 1's maximum value {}".format(
+                translation_bone.getBlenderName(), v1_max
+            )
+        )
+        return False
+
+    if len({range.height for range in axis_detent_ranges}) == 1:
+        logger.warn(
+            "All axis detent ranges for {} have the same height. Check your entered data".format(
+                translation_bone.getBlenderName()
+            )
+        )
+
+    for i in range(len(axis_detent_ranges)):
+        detent_range = axis_detent_ranges[i]
+        if not detent_range.start <= detent_range.end:
+            logger.error(
+                "The start of axis detent range {} on {} must be less than or equal to its end".format(
+                    detent_range, translation_bone.getBlenderName()
+                )
+            )
+            return False
+
+        if not 0.0 <= detent_range.height <= lift_at_max:
+            logger.error(
+                "Height in axis detent range {} on {} must be between 0.0 and the maximum lift height ({})".format(
+                    detent_range,
+                    translation_bone.getBlenderName(),
+                    lift_at_max,
+                )
+            )
+            return False
+
+        # Pit detection portion
+        if (
+            len(axis_detent_ranges) == 1
+            and detent_range.start == detent_range.end
+        ):
+            logger.error(
+                "Axis detent range on {} cannot have stop pit with only one detent".format(
+                    translation_bone.getBlenderName()
+                )
+            )
+            return False
+
+        try:
+            detent_range_next = axis_detent_ranges[i + 1]
+        except IndexError:
+            detent_range_next = AxisDetentStruct(
+                detent_range.end, v1_max, float("inf")
+            )
+
+        if not detent_range.end == detent_range_next.start:
+            logger.error(
+                "In {}'s axis detent range list, the start of a detent range must be the end of the previous detent range {},{}".format(
+                    translation_bone.getBlenderName(),
+                    detent_range,
+                    (
+                        detent_range_next.start,
+                        detent_range_next.end,
+                        detent_range.height,
+                    ),
+                )
+            )
+            return False
+
+        try:
+            detent_range_prev = (
+                axis_detent_ranges[i - 1]
+                if i > 0
+                else AxisDetentStruct(
+                    v1_min, detent_range.start, float("inf")
+                )
+            )
+        except IndexError:
+            detent_range_prev = AxisDetentStruct(
+                v1_min, detent_range.start, float("inf")
+            )
+
+        if (
+            detent_range.start == detent_range.end
+            and not detent_range_prev.height
+            > detent_range.height
+            < detent_range_next.height
+        ):
+            logger.error(
+                "Stop pit created by {}'s detent range {} must be lower than"
+                " previous {} and next detent ranges {}".format(
+                    translation_bone.getBlenderName(),
+                    (detent_range),
+                    (
+                        detent_range_prev.start,
+                        detent_range_prev.end,
+                        detent_range.height,
+                    ),
+                    (
+                        detent_range_next.start,
+                        detent_range_next.end,
+                        detent_range_next.height,
+                    ),
+                )
+            )
+            return False
+
+    return True
+
+
+# Manipulator types whose attribute value is a straight tuple of manip
+# properties, mapped to those property names in OBJ argument order.
+# Types that derive their values from animation data (drag axis and drag
+# rotate families) keep dedicated branches in XPlaneManipulator.collect
+_MANIP_VALUE_PROPS = {
+    MANIP_DRAG_XY: (
+        "cursor",
+        "dx",
+        "dy",
+        "v1_min",
+        "v1_max",
+        "v2_min",
+        "v2_max",
+        "dataref1",
+        "dataref2",
+        "tooltip",
+    ),
+    MANIP_DRAG_AXIS: ("cursor", "dx", "dy", "dz", "v1", "v2", "dataref1", "tooltip"),
+    MANIP_DRAG_AXIS_PIX: (
+        "cursor",
+        "dx",
+        "step",
+        "exp",
+        "v1",
+        "v2",
+        "dataref1",
+        "tooltip",
+    ),
+    MANIP_COMMAND: ("cursor", "command", "tooltip"),
+    MANIP_COMMAND_AXIS: (
+        "cursor",
+        "dx",
+        "dy",
+        "dz",
+        "positive_command",
+        "negative_command",
+        "tooltip",
+    ),
+    MANIP_COMMAND_KNOB: ("cursor", "positive_command", "negative_command", "tooltip"),
+    MANIP_COMMAND_SWITCH_UP_DOWN: (
+        "cursor",
+        "positive_command",
+        "negative_command",
+        "tooltip",
+    ),
+    MANIP_COMMAND_SWITCH_LEFT_RIGHT: (
+        "cursor",
+        "positive_command",
+        "negative_command",
+        "tooltip",
+    ),
+    MANIP_COMMAND_KNOB2: ("cursor", "command", "tooltip"),
+    MANIP_COMMAND_SWITCH_UP_DOWN2: ("cursor", "command", "tooltip"),
+    MANIP_COMMAND_SWITCH_LEFT_RIGHT2: ("cursor", "command", "tooltip"),
+    MANIP_PUSH: ("cursor", "v_down", "v_up", "dataref1", "tooltip"),
+    MANIP_RADIO: ("cursor", "v_down", "dataref1", "tooltip"),
+    MANIP_TOGGLE: ("cursor", "v_on", "v_off", "dataref1", "tooltip"),
+    MANIP_DELTA: (
+        "cursor",
+        "v_down",
+        "v_hold",
+        "v1_min",
+        "v1_max",
+        "dataref1",
+        "tooltip",
+    ),
+    MANIP_WRAP: (
+        "cursor",
+        "v_down",
+        "v_hold",
+        "v1_min",
+        "v1_max",
+        "dataref1",
+        "tooltip",
+    ),
+    MANIP_AXIS_KNOB: (
+        "cursor",
+        "v1",
+        "v2",
+        "click_step",
+        "hold_step",
+        "dataref1",
+        "tooltip",
+    ),
+    MANIP_AXIS_SWITCH_UP_DOWN: (
+        "cursor",
+        "v1",
+        "v2",
+        "click_step",
+        "hold_step",
+        "dataref1",
+        "tooltip",
+    ),
+    MANIP_AXIS_SWITCH_LEFT_RIGHT: (
+        "cursor",
+        "v1",
+        "v2",
+        "click_step",
+        "hold_step",
+        "dataref1",
+        "tooltip",
+    ),
+    MANIP_NOOP: ("dataref1", "tooltip"),
+}
+
+
 class XPlaneManipulator:
     """
     This psuedo-XPlaneObject only has a collect method,
@@ -901,44 +1151,11 @@ class XPlaneManipulator:
         if self.manip.enabled:
             attr += self.type
 
-            if self.type == MANIP_DRAG_XY:
-                value = (
-                    self.manip.cursor,
-                    self.manip.dx,
-                    self.manip.dy,
-                    self.manip.v1_min,
-                    self.manip.v1_max,
-                    self.manip.v2_min,
-                    self.manip.v2_max,
-                    self.manip.dataref1,
-                    self.manip.dataref2,
-                    self.manip.tooltip,
-                )
-            elif (
-                self.type == MANIP_DRAG_AXIS
-                and not self.manip.autodetect_settings_opt_in
+            value_props = _MANIP_VALUE_PROPS.get(self.type)
+            if value_props is not None and not (
+                self.type == MANIP_DRAG_AXIS and self.manip.autodetect_settings_opt_in
             ):
-                value = (
-                    self.manip.cursor,
-                    self.manip.dx,
-                    self.manip.dy,
-                    self.manip.dz,
-                    self.manip.v1,
-                    self.manip.v2,
-                    self.manip.dataref1,
-                    self.manip.tooltip,
-                )
-            elif self.type == MANIP_DRAG_AXIS_PIX:
-                value = (
-                    self.manip.cursor,
-                    self.manip.dx,
-                    self.manip.step,
-                    self.manip.exp,
-                    self.manip.v1,
-                    self.manip.v2,
-                    self.manip.dataref1,
-                    self.manip.tooltip,
-                )
+                value = tuple(getattr(self.manip, prop) for prop in value_props)
             elif (
                 self.type == MANIP_DRAG_AXIS and self.manip.autodetect_settings_opt_in
             ) or self.type == MANIP_DRAG_AXIS_DETENT:
@@ -1245,84 +1462,6 @@ class XPlaneManipulator:
                     self.manip.dataref2,
                     self.manip.tooltip,
                 )
-            elif self.type == MANIP_COMMAND:
-                value = (self.manip.cursor, self.manip.command, self.manip.tooltip)
-            elif self.type == MANIP_COMMAND_AXIS:
-                value = (
-                    self.manip.cursor,
-                    self.manip.dx,
-                    self.manip.dy,
-                    self.manip.dz,
-                    self.manip.positive_command,
-                    self.manip.negative_command,
-                    self.manip.tooltip,
-                )
-            elif self.type in (
-                MANIP_COMMAND_KNOB,
-                MANIP_COMMAND_SWITCH_UP_DOWN,
-                MANIP_COMMAND_SWITCH_LEFT_RIGHT,
-            ):
-                value = (
-                    self.manip.cursor,
-                    self.manip.positive_command,
-                    self.manip.negative_command,
-                    self.manip.tooltip,
-                )
-            elif self.type in (
-                MANIP_COMMAND_KNOB2,
-                MANIP_COMMAND_SWITCH_UP_DOWN2,
-                MANIP_COMMAND_SWITCH_LEFT_RIGHT2,
-            ):
-                value = (self.manip.cursor, self.manip.command, self.manip.tooltip)
-            elif self.type == MANIP_PUSH:
-                value = (
-                    self.manip.cursor,
-                    self.manip.v_down,
-                    self.manip.v_up,
-                    self.manip.dataref1,
-                    self.manip.tooltip,
-                )
-            elif self.type == MANIP_RADIO:
-                value = (
-                    self.manip.cursor,
-                    self.manip.v_down,
-                    self.manip.dataref1,
-                    self.manip.tooltip,
-                )
-            elif self.type == MANIP_TOGGLE:
-                value = (
-                    self.manip.cursor,
-                    self.manip.v_on,
-                    self.manip.v_off,
-                    self.manip.dataref1,
-                    self.manip.tooltip,
-                )
-            elif self.type in (MANIP_DELTA, MANIP_WRAP):
-                value = (
-                    self.manip.cursor,
-                    self.manip.v_down,
-                    self.manip.v_hold,
-                    self.manip.v1_min,
-                    self.manip.v1_max,
-                    self.manip.dataref1,
-                    self.manip.tooltip,
-                )
-            elif self.type in (
-                MANIP_AXIS_KNOB,
-                MANIP_AXIS_SWITCH_UP_DOWN,
-                MANIP_AXIS_SWITCH_LEFT_RIGHT,
-            ):
-                value = (
-                    self.manip.cursor,
-                    self.manip.v1,
-                    self.manip.v2,
-                    self.manip.click_step,
-                    self.manip.hold_step,
-                    self.manip.dataref1,
-                    self.manip.tooltip,
-                )
-            elif self.type == MANIP_NOOP:
-                value = (self.manip.dataref1, self.manip.tooltip)
             else:
                 msg = "Manipulator type %s is unknown or unimplemented" % self.type
                 logger.error(msg)
@@ -1374,157 +1513,6 @@ class XPlaneManipulator:
                 self.type == MANIP_DRAG_AXIS_DETENT
                 or self.type == MANIP_DRAG_ROTATE_DETENT
             ) and ver_ge_1100:
-
-                # List[AxisDetentRange] -> bool
-                def validate_axis_detent_ranges(
-                    axis_detent_ranges, translation_bone, v1_min, v1_max, lift_at_max
-                ):
-                    """
-                    Rules for Axis Detent Ranges
-
-                    Basic rules
-                    - Manip type must be *_DETENT
-                    - Translation bone must not be none (covered by get_translation_bone), len(axis_detent_ranges) > 0
-                    - The detent ranges must cover [v1_min,v1_max] without gaps.
-                      Therefore
-                          - The start of one range must be the end of another
-                          - ranges[0].start == v1_min, ranges[-1].end == v1_max
-                    - A range's start must be <= its end
-                    - Height must be between 0 and lift_at_max
-
-                    Stop Pits
-                    - A stop pit is defined as range.start == range.end, range.height is less than each of it's neighbors.
-                    - A pit can be the first or last detent range, but never the only one
-                    - Stop pegs, where height is equal to or greater than it's neighbor's height, are never allowed
-                    """
-                    if not len(axis_detent_ranges) > 0:
-                        logger.error(
-                            "Must {} have axis detent range if manipulator type is {}".format(
-                                translation_bone.getBlenderName(),
-                                self.manip.get_effective_type_name(),
-                            )
-                        )
-                        return False
-
-                    if not axis_detent_ranges[0].start == v1_min:
-                        logger.error(
-                            "Axis detent range list for {} must start at Dataref 1's minimum value {}".format(
-                                translation_bone.getBlenderName(), v1_min
-                            )
-                        )
-                        return False
-
-                    if not axis_detent_ranges[-1].end == v1_max:
-                        logger.error(
-                            "Axis detent range list for {} must end at Dataref 1's maximum value {}".format(
-                                translation_bone.getBlenderName(), v1_max
-                            )
-                        )
-                        return False
-
-                    if len({range.height for range in axis_detent_ranges}) == 1:
-                        logger.warn(
-                            "All axis detent ranges for {} have the same height. Check your entered data".format(
-                                translation_bone.getBlenderName()
-                            )
-                        )
-
-                    for i in range(len(axis_detent_ranges)):
-                        detent_range = axis_detent_ranges[i]
-                        if not detent_range.start <= detent_range.end:
-                            logger.error(
-                                "The start of axis detent range {} on {} must be less than or equal to its end".format(
-                                    detent_range, translation_bone.getBlenderName()
-                                )
-                            )
-                            return False
-
-                        if not 0.0 <= detent_range.height <= lift_at_max:
-                            logger.error(
-                                "Height in axis detent range {} on {} must be between 0.0 and the maximum lift height ({})".format(
-                                    detent_range,
-                                    translation_bone.getBlenderName(),
-                                    lift_at_max,
-                                )
-                            )
-                            return False
-
-                        # Pit detection portion
-                        if (
-                            len(axis_detent_ranges) == 1
-                            and detent_range.start == detent_range.end
-                        ):
-                            logger.error(
-                                "Axis detent range on {} cannot have stop pit with only one detent".format(
-                                    translation_bone.getBlenderName()
-                                )
-                            )
-                            return False
-
-                        AxisDetentStruct = collections.namedtuple(
-                            "AxisDetentStruct", ["start", "end", "height"]
-                        )
-                        try:
-                            detent_range_next = axis_detent_ranges[i + 1]
-                        except IndexError:
-                            detent_range_next = AxisDetentStruct(
-                                detent_range.end, v1_max, float("inf")
-                            )
-
-                        if not detent_range.end == detent_range_next.start:
-                            logger.error(
-                                "In {}'s axis detent range list, the start of a detent range must be the end of the previous detent range {},{}".format(
-                                    translation_bone.getBlenderName(),
-                                    detent_range,
-                                    (
-                                        detent_range_next.start,
-                                        detent_range_next.end,
-                                        detent_range.height,
-                                    ),
-                                )
-                            )
-                            return False
-
-                        try:
-                            detent_range_prev = (
-                                axis_detent_ranges[i - 1]
-                                if i > 0
-                                else AxisDetentStruct(
-                                    v1_min, detent_range.start, float("inf")
-                                )
-                            )
-                        except IndexError:
-                            detent_range_prev = AxisDetentStruct(
-                                v1_min, detent_range.start, float("inf")
-                            )
-
-                        if (
-                            detent_range.start == detent_range.end
-                            and not detent_range_prev.height
-                            > detent_range.height
-                            < detent_range_next.height
-                        ):
-                            logger.error(
-                                "Stop pit created by {}'s detent range {} must be lower than"
-                                " previous {} and next detent ranges {}".format(
-                                    translation_bone.getBlenderName(),
-                                    (detent_range),
-                                    (
-                                        detent_range_prev.start,
-                                        detent_range_prev.end,
-                                        detent_range.height,
-                                    ),
-                                    (
-                                        detent_range_next.start,
-                                        detent_range_next.end,
-                                        detent_range_next.height,
-                                    ),
-                                )
-                            )
-                            return False
-
-                    return True
-
                 if len(self.manip.axis_detent_ranges) > 0:
                     if self.type == MANIP_DRAG_AXIS_DETENT:
                         translation_bone = detent_axis_bone
@@ -1534,6 +1522,7 @@ class XPlaneManipulator:
                         v1_min,
                         v1_max,
                         lift_at_max,
+                        manipulator=self,
                     ):
                         return
 
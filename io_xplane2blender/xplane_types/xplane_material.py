@@ -99,9 +99,10 @@ class XPlaneMaterial:
             mat = self.blenderObject.material_slots[0].material
             self.name = mat.name
             self.blenderMaterial = mat
-            self.options = mat.xplane  # type: xplane_props.XPlaneMaterialSettings
+            mat_options = mat.xplane  # type: xplane_props.XPlaneMaterialSettings
+            self.options = mat_options
 
-            if mat.xplane.draw:
+            if mat_options.draw:
                 self.attributes["ATTR_draw_enable"].setValue(True)
 
                 # add cockpit attributes
@@ -114,15 +115,15 @@ class XPlaneMaterial:
                 self.collectConditions(mat)
 
                 # polygon offsett attribute
-                if mat.xplane.poly_os > 0:
-                    self.attributes["ATTR_poly_os"].setValue(mat.xplane.poly_os)
+                if mat_options.poly_os > 0:
+                    self.attributes["ATTR_poly_os"].setValue(mat_options.poly_os)
 
-                if mat.xplane.cockpit_feature == COCKPIT_FEATURE_NONE:
+                if mat_options.cockpit_feature == COCKPIT_FEATURE_NONE:
                     xplane_version = int(bpy.context.scene.xplane.version)
                     self.attributes["ATTR_draw_enable"].setValue(True)
                     eff_fn = (
                         effective_normal_metalness_draped
-                        if mat.xplane.draped
+                        if mat_options.draped
                         else effective_normal_metalness
                     )
                     xp_file = self.xplaneObject.xplaneBone.xplaneFile
@@ -133,29 +134,29 @@ class XPlaneMaterial:
 
                     # blend
                     if xplane_version >= 1000:
-                        xplane_blend_enum = mat.xplane.blend_v1000
+                        xplane_blend_enum = mat_options.blend_v1000
 
                     if xplane_version >= 1000:
                         if xplane_blend_enum == BLEND_OFF:
                             self.attributes["ATTR_no_blend"].setValue(
-                                mat.xplane.blendRatio
+                                mat_options.blendRatio
                             )
                         elif xplane_blend_enum == BLEND_ON:
                             self.attributes["ATTR_blend"].setValue(True)
                         elif xplane_blend_enum == BLEND_SHADOW:
                             self.attributes["ATTR_shadow_blend"].setValue(
-                                mat.xplane.blendRatio
+                                mat_options.blendRatio
                             )
                     elif xplane_version < 1000:
-                        if mat.xplane.blend:
+                        if mat_options.blend:
                             self.attributes["ATTR_no_blend"].setValue(
-                                mat.xplane.blendRatio
+                                mat_options.blendRatio
                             )
                         else:
                             self.attributes["ATTR_blend"].setValue(True)
 
                     if xplane_version >= 1010:
-                        if mat.xplane.shadow_local:
+                        if mat_options.shadow_local:
                             self.attributes["ATTR_shadow"].setValue(True)
                             self.attributes["ATTR_no_shadow"].setValue(False)
                         else:
@@ -163,7 +164,7 @@ class XPlaneMaterial:
                             self.attributes["ATTR_no_shadow"].setValue(True)
 
                 # draped
-                if mat.xplane.draped:
+                if mat_options.draped:
                     self.attributes["ATTR_draped"].setValue(True)
                     self.attributes["ATTR_no_draped"].setValue(False)
                 else:
@@ -172,16 +173,16 @@ class XPlaneMaterial:
                 self.attributes["ATTR_draw_disable"].setValue(True)
 
             # surface type
-            if mat.xplane.surfaceType != SURFACE_TYPE_NONE:
-                if mat.xplane.deck:
-                    self.attributes["ATTR_hard_deck"].setValue(mat.xplane.surfaceType)
+            if mat_options.surfaceType != SURFACE_TYPE_NONE:
+                if mat_options.deck:
+                    self.attributes["ATTR_hard_deck"].setValue(mat_options.surfaceType)
                 else:
-                    self.attributes["ATTR_hard"].setValue(mat.xplane.surfaceType)
+                    self.attributes["ATTR_hard"].setValue(mat_options.surfaceType)
             else:
                 self.attributes["ATTR_no_hard"].setValue(True)
 
             # camera collision
-            if mat.xplane.solid_camera:
+            if mat_options.solid_camera:
                 self.attributes["ATTR_solid_camera"].setValue(True)
                 self.attributes["ATTR_no_solid_camera"].setValue(False)
             else:
@@ -210,28 +211,29 @@ class XPlaneMaterial:
                 self.attributes.add(XPlaneAttribute(attr.name, attr.value, attr.weight))
 
     def collectCockpitAttributes(self, mat: bpy.types.Material) -> None:
+        mat_options = mat.xplane
         xplane_version = int(bpy.context.scene.xplane.version)
         if xplane_version >= 1100:
-            if mat.xplane.cockpit_feature == COCKPIT_FEATURE_DEVICE:
+            if mat_options.cockpit_feature == COCKPIT_FEATURE_DEVICE:
                 self.cockpitAttributes["ATTR_cockpit_device"].setValue(
                     [
-                        mat.xplane.device_name,
+                        mat_options.device_name,
                         bin(
                             sum(
                                 getattr(mat.xplane, f"device_bus_{i}") << i
                                 for i in range(6)
                             )
                         )[2:],
-                        mat.xplane.device_lighting_channel,
-                        mat.xplane.device_auto_adjust,
+                        mat_options.device_lighting_channel,
+                        mat_options.device_auto_adjust,
                     ]
                 )
                 self.cockpitAttributes["ATTR_no_cockpit"].setValue(None)
 
-        if mat.xplane.cockpit_feature == COCKPIT_FEATURE_PANEL:
+        if mat_options.cockpit_feature == COCKPIT_FEATURE_PANEL:
             xplaneFile = self.xplaneObject.xplaneBone.xplaneFile
             cockpit_panel_mode = xplaneFile.options.cockpit_panel_mode
-            cockpit_region = int(mat.xplane.cockpit_region)
+            cockpit_region = int(mat_options.cockpit_region)
 
             self.cockpitAttributes["ATTR_no_cockpit"].setValue(None)
             if xplane_version >= 1110:
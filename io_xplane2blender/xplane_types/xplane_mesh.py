@@ -1,18 +1,11 @@
-import array
-import collections
-import re
-import time
-from typing import List, Optional
+from typing import List
 
 import bpy
-import mathutils
-
-from io_xplane2blender import xplane_helpers
+import numpy as np
 
 from ..xplane_config import getDebug
 from ..xplane_constants import *
-from ..xplane_helpers import floatToStr, logger
-from .xplane_face import XPlaneFace
+from ..xplane_helpers import floatToStr
 from .xplane_object import XPlaneObject
 
 
@@ -25,16 +18,57 @@ class XPlaneMesh:
     """
 
     def __init__(self):
-        # Contains all OBJ VT directives, data in the order as specified by the OBJ8 spec
-        self.vertices = (
-            []
-        )  # type: List[Tuple[float, float, float, float, float, float, float, float]]
-        # array - contains all face indices
-        self.indices = array.array("i")  # type: List[int]
+        # Backing buffer for all OBJ VT directives, one row per VT entry,
+        # data in the order as specified by the OBJ8 spec. Keeping this as
+        # one (n, 8) block instead of a list of tuples avoids boxing every
+        # float of every vertex as a Python object
+        self._vt_table = np.empty((1024, 8))  # type: np.ndarray
+        self._vt_count = 0
+        # Backing buffer for all face indices, same growth scheme
+        self._idx_table = np.empty(1024, dtype=np.int32)  # type: np.ndarray
+        self._idx_count = 0
         # int - Stores the current global vertex index.
         self.globalindex = 0
         self.debug = []
 
+    @property
+    def vertices(self) -> np.ndarray:
+        """All collected VT entries as an (n, 8) array"""
+        return self._vt_table[: self._vt_count]
+
+    @property
+    def indices(self) -> np.ndarray:
+        """All collected face indices as an (n,) array"""
+        return self._idx_table[: self._idx_count]
+
+    def _appendVertices(self, vt_entries: np.ndarray) -> None:
+        """
+        Appends (n, 8) VT rows to the vertex table, growing the backing
+        buffer geometrically as needed
+        """
+        needed = self._vt_count + len(vt_entries)
+        if needed > len(self._vt_table):
+            new_capacity = len(self._vt_table)
+            while new_capacity < needed:
+                new_capacity *= 2
+            self._vt_table = np.resize(self._vt_table, (new_capacity, 8))
+        self._vt_table[self._vt_count : needed] = vt_entries
+        self._vt_count = needed
+
+    def _appendIndices(self, indices: np.ndarray) -> None:
+        """
+        Appends face indices to the index table, growing the backing
+        buffer geometrically as needed
+        """
+        needed = self._idx_count + len(indices)
+        if needed > len(self._idx_table):
+            new_capacity = len(self._idx_table)
+            while new_capacity < needed:
+                new_capacity *= 2
+            self._idx_table = np.resize(self._idx_table, new_capacity)
+        self._idx_table[self._idx_count : needed] = indices
+        self._idx_count = needed
+
     # Method: collectXPlaneObjects
     # Fills the <vertices> and <indices> from a list of <XPlaneObjects>.
     # This method works recursively on the children of each <XPlaneObject>.
@@ -87,70 +121,90 @@ class XPlaneMesh:
                 except (KeyError, TypeError) as e:
                     uv_layer = None
 
-                TempFace = collections.namedtuple(
-                    "TempFace",
-                    field_names=[
-                        "original_face",  # type: bpy.types.MeshLoopTriangle
-                        "indices",  # type: Tuple[float, float, float]
-                        "normal",  # type: Tuple[float, float, float]
-                        "split_normals",  # type: Tuple[Tuple[float, float, float], Tuple[float, float, float], Tuple[float, float, float]]
-                        "uvs",  # type: Tuple[mathutils.Vector, mathutils.Vector, mathutils.Vector]
-                    ],
-                )
-                tmp_faces = []  # type: List[TempFace]
-                for tri in mesh.loop_triangles:
-                    tmp_face = TempFace(
-                        original_face=tri,
-                        # BAD NAME ALERT!
-                        # mesh.vertices is the actual vertex table,
-                        # tri.vertices is indices in that vertex table
-                        indices=tri.vertices,
-                        normal=tri.normal,
-                        split_normals=tri.split_normals,
-                        uvs=tuple(
-                            uv_layer.data[loop_index].uv for loop_index in tri.loops
-                        )
-                        if uv_layer
-                        else (mathutils.Vector((0.0, 0.0)),) * 3,
+                num_tris = len(loop_triangles)
+
+                # Pull everything out of the mesh in bulk - going through
+                # mesh.vertices[i].co etc. per corner costs a Python
+                # attribute lookup and a Vector allocation each time
+                mesh_vertices_co = np.empty(len(mesh.vertices) * 3)
+                mesh.vertices.foreach_get("co", mesh_vertices_co)
+                mesh_vertices_co = mesh_vertices_co.reshape(-1, 3)
+
+                # BAD NAME ALERT!
+                # mesh.vertices is the actual vertex table,
+                # tri.vertices is indices in that vertex table
+                tri_vertices = np.empty(num_tris * 3, dtype=np.int32)
+                loop_triangles.foreach_get("vertices", tri_vertices)
+
+                split_normals = np.empty(num_tris * 9)
+                loop_triangles.foreach_get("split_normals", split_normals)
+                split_normals = split_normals.reshape(-1, 3)
+
+                tri_normals = np.empty(num_tris * 3)
+                loop_triangles.foreach_get("normal", tri_normals)
+                tri_normals = tri_normals.reshape(-1, 3)
+
+                use_smooth = np.empty(num_tris, dtype=bool)
+                loop_triangles.foreach_get("use_smooth", use_smooth)
+
+                if uv_layer:
+                    tri_loops = np.empty(num_tris * 3, dtype=np.int32)
+                    loop_triangles.foreach_get("loops", tri_loops)
+                    uvs = np.empty(len(uv_layer.data) * 2)
+                    uv_layer.data.foreach_get("uv", uvs)
+                    uvs = uvs.reshape(-1, 2)[tri_loops]
+                else:
+                    uvs = np.zeros((num_tris * 3, 2))
+
+                # One row per loop triangle corner, laid out as a VT table
+                # entry: location, normal, uv
+                corners = np.empty((num_tris * 3, 8))
+                corners[:, 0:3] = mesh_vertices_co[tri_vertices]
+                corners[:, 3:6] = split_normals
+                flat = np.repeat(~use_smooth, 3)
+                corners[flat, 3:6] = np.repeat(tri_normals[~use_smooth], 3, axis=0)
+                corners[:, 6:8] = uvs
+
+                # Blender -> X-Plane coordinates, see vec_b_to_x
+                corners[:, [1, 2, 4, 5]] = corners[:, [2, 1, 5, 4]]
+                corners[:, 2] = -corners[:, 2]
+                corners[:, 5] = -corners[:, 5]
+
+                # To reverse the winding order for X-Plane from CCW to CW,
+                # each triangle's corners are emitted backwards
+                vt_entries = corners.reshape(-1, 3, 8)[:, ::-1, :].reshape(-1, 8)
+
+                # Optimization Algorithm:
+                # Deduplicate this object's VT entries so matching corners
+                # share one index in the mesh's index table
+                if bpy.context.scene.xplane.optimize:
+                    # Adding 0.0 folds -0.0 into 0.0 for the keys only, so
+                    # rows differing just in the sign of a zero still compare
+                    # equal as they did as Python tuple keys. np.unique sorts
+                    # stably when return_index is given, so reordering the
+                    # unique rows by first occurrence reproduces the old
+                    # first-seen order and representative rows exactly
+                    keys = vt_entries + 0.0
+                    _, first_idx, inverse = np.unique(
+                        keys, axis=0, return_index=True, return_inverse=True
+                    )
+                    order = np.argsort(first_idx)
+                    rank = np.empty_like(order)
+                    rank[order] = np.arange(len(order))
+                    new_vt_entries = vt_entries[np.sort(first_idx)]
+                    vindices = rank[inverse.reshape(-1)] + self.globalindex
+                else:
+                    new_vt_entries = vt_entries
+                    vindices = np.arange(
+                        self.globalindex, self.globalindex + len(vt_entries)
                     )
-                    tmp_faces.append(tmp_face)
-
-                vertices_dct = {}
-                for tmp_face in tmp_faces:
-                    # To reverse the winding order for X-Plane from CCW to CW,
-                    # we iterate backwards through the mesh data structures
-                    for i in reversed(range(0, 3)):
-                        index = tmp_face.indices[i]
-                        vertex = xplane_helpers.vec_b_to_x(mesh.vertices[index].co)
-                        normal = xplane_helpers.vec_b_to_x(
-                            tmp_face.split_normals[i]
-                            if tmp_face.original_face.use_smooth
-                            else tmp_face.normal
-                        )
-                        uv = tmp_face.uvs[i]
-                        vt_entry = tuple(vertex[:] + normal[:] + uv[:])
-
-                        # Optimization Algorithm:
-                        # Try to find a matching vt_entry's index in the mesh's index table
-                        # If found, skip adding to global vertices list
-                        # If not found (-1), append the new vert, save its vertex
-                        if bpy.context.scene.xplane.optimize:
-                            vindex = vertices_dct.get(vt_entry, -1)
-                        else:
-                            vindex = -1
-
-                        if vindex == -1:
-                            vindex = self.globalindex
-                            self.vertices.append(vt_entry)
-                            self.globalindex += 1
-
-                        if bpy.context.scene.xplane.optimize:
-                            vertices_dct[vt_entry] = vindex
-
-                        self.indices.append(vindex)
-
-                    # store the faces in the prim
-                    xplaneObject.indices[1] = len(self.indices)
+
+                self._appendVertices(new_vt_entries)
+                self.globalindex += len(new_vt_entries)
+                self._appendIndices(vindices)
+
+                # store the faces in the prim
+                xplaneObject.indices[1] = len(self.indices)
 
                 evaluated_obj.to_mesh_clear()
 
@@ -165,20 +219,23 @@ class XPlaneMesh:
         # start = time.perf_counter()
         debug = getDebug()
         tab = f"\t"
+        # One bulk conversion to plain Python floats - formatting numpy
+        # scalars one at a time in the loops below is several times slower
+        lines = self.vertices.tolist()
         if debug:
             s = "".join(
                 f"VT\t"
                 f"{tab.join(floatToStr(component) for component in line)}"
                 f"\t# {i}"
                 f"\n"
-                for i, line in enumerate(self.vertices)
+                for i, line in enumerate(lines)
             )
             # print("end XPlaneMesh.writeVertices " + str(time.perf_counter()-start))
             return s
         else:
             s = "".join(
                 f"VT\t" f"{tab.join(floatToStr(component) for component in line)}" f"\n"
-                for line in self.vertices
+                for line in lines
             )
             # print("end XPlaneMesh.writeVertices " + str(time.perf_counter()-start))
             return s
@@ -196,22 +253,16 @@ class XPlaneMesh:
 
         s_idx10 = "IDX10\t%d\t%d\t%d\t%d\t%d\t%d\t%d\t%d\t%d\t%d\n"
         s_idx = "IDX\t%d\n"
-        partition_point = len(self.indices) - (len(self.indices) % 10)
-
-        if len(self.indices) >= 10:
-            o += "".join(
-                [
-                    s_idx10 % (*self.indices[i : i + 10],)
-                    for i in range(0, partition_point - 1, 10)
-                ]
-            )
+        indices = self.indices
+        partition_point = len(indices) - (len(indices) % 10)
 
+        # Slicing rows out of a (n, 10) view replaces the index arithmetic
+        # loop, and one tolist() hands the formatter plain Python ints
         o += "".join(
-            [
-                s_idx % (self.indices[i])
-                for i in range(partition_point, len(self.indices))
-            ]
+            s_idx10 % tuple(row)
+            for row in indices[:partition_point].reshape(-1, 10).tolist()
         )
+        o += "".join(s_idx % index for index in indices[partition_point:].tolist())
         # print("End XPlaneMesh.writeIndices: " + str(time.perf_counter()-start))
         return o
 
@@ -1,10 +1,4 @@
-import collections
-import math
-import sys
-from typing import Any
-
 import bpy
-from mathutils import Vector
 
 from io_xplane2blender import xplane_helpers
 from io_xplane2blender.xplane_constants import (
@@ -46,12 +40,12 @@ class XPlanePrimitive(XPlaneObject):
         ):
             mat_weight = 0
 
-            for i in range(0, len(bpy.data.materials)):
-                if (
-                    len(self.blenderObject.data.materials) > 0
-                    and self.blenderObject.data.materials[0] == bpy.data.materials[i]
-                ):
-                    mat_weight = i
+            if len(self.blenderObject.data.materials) > 0:
+                first_mat = self.blenderObject.data.materials[0]
+                if first_mat is not None:
+                    # find is a C-level name lookup, replacing a scan of
+                    # every material in the blend file per exported object
+                    mat_weight = max(0, bpy.data.materials.find(first_mat.name))
 
             self.weight += mat_weight
 
@@ -584,7 +584,7 @@ def update(
         "4.0.0-beta.2+88.20200622133200"
     ):
         # Remember, get returning 0 and return None means something different
-        for light in filter(lambda l: l.xplane.get("type") is None, bpy.data.lights):
+        for light in (l for l in bpy.data.lights if l.xplane.get("type") is None):
             light.xplane.type = xplane_constants.LIGHT_DEFAULT
 
     if last_version < xplane_helpers.VerStruct.parse_version(